@@ -3,119 +3,100 @@
 Basic Usage Examples for Rippling API Client
 
 This script demonstrates the fundamental patterns for using the Rippling API client.
+The listings are independent of each other, so they are fetched concurrently with
+the async client and printed once all of them have landed.
 Before running, ensure you have a .env file with RIPPLING_BEARER_TOKEN set.
 """
 
-import os
-import sys
+import asyncio
 
-from dotenv import load_dotenv
+from _common import (
+    gather_listings,
+    get_settings,
+    open_async_client,
+    print_banner,
+    report_failure,
+)
 
-# Load environment variables from .env file
-load_dotenv()
 
-from rippling_client import RipplingAPIError, RipplingSettings, SyncRipplingClient
+def show_companies(companies):
+    print(f"Found {len(companies)} company/companies")
+    for company in companies:
+        print(f"  - {company.name} (ID: {company.id})")
 
 
-def get_settings() -> RipplingSettings:
-    """Load settings from environment variables."""
-    bearer_token = os.getenv("RIPPLING_BEARER_TOKEN")
-    if not bearer_token:
-        print("ERROR: RIPPLING_BEARER_TOKEN environment variable is required")
-        print("Set it in your .env file or export it in your shell")
-        sys.exit(1)
+def show_workers(workers):
+    print(f"Fetched {len(workers)} workers")
+    for worker in workers[:5]:  # Show first 5
+        print(f"  - {worker.id}")
 
-    # Optional: Override base URL for sandbox/testing
-    base_url = os.getenv("RIPPLING_BASE_URL", "https://rest.ripplingapis.com")
 
-    return RipplingSettings(
-        bearer_token=bearer_token,  # type: ignore[arg-type]
-        base_url=base_url,
-    )
+def show_users(users):
+    print(f"Fetched {len(users)} users")
+    for user in users[:5]:  # Show first 5
+        display_name = getattr(user, "display_name", None) or getattr(
+            user, "email", user.id
+        )
+        print(f"  - {display_name}")
 
 
-def main():
+def show_departments(departments):
+    print(f"Fetched {len(departments)} departments")
+    for dept in departments[:10]:  # Show first 10
+        print(f"  - {dept.name} (ID: {dept.id})")
+
+
+def show_work_locations(locations):
+    print(f"Fetched {len(locations)} work locations")
+    for loc in locations[:10]:  # Show first 10
+        print(f"  - {loc.name} (ID: {loc.id})")
+
+
+# (section heading, label used in error messages, printer) - in display order
+EXAMPLES = (
+    ("Example 1: List Companies", "companies", show_companies),
+    ("Example 2: List Workers (limited to 25 for demo)", "workers", show_workers),
+    ("Example 3: List Users (limited to 25 for demo)", "users", show_users),
+    ("Example 4: List Departments (limited to 25)", "departments", show_departments),
+    (
+        "Example 5: List Work Locations (limited to 25)",
+        "work locations",
+        show_work_locations,
+    ),
+)
+
+
+async def main():
     # =========================================================================
     # Initialize client with explicit settings
     # =========================================================================
-    print("=" * 60)
-    print("Initializing Rippling Client")
-    print("=" * 60)
+    print_banner("Initializing Rippling Client", leading_newline=False)
 
     settings = get_settings()
     print(f"Using API base URL: {settings.base_url}")
 
     # Create the client with settings
-    with SyncRipplingClient(settings=settings) as client:
-        # =====================================================================
-        # Example 1: List Companies
-        # =====================================================================
-        print("\n--- Example 1: List Companies ---")
-        try:
-            companies = list(client.companies.list())
-            print(f"Found {len(companies)} company/companies")
-            for company in companies:
-                print(f"  - {company.name} (ID: {company.id})")
-        except RipplingAPIError as e:
-            print(f"Error fetching companies: {e}")
-
+    async with open_async_client() as client:
         # =====================================================================
-        # Example 2: List Employees/Workers
+        # Launch every listing at once - wall time is the slowest request
+        # rather than the sum of all of them
         # =====================================================================
-        print("\n--- Example 2: List Workers (limited to 25 for demo) ---")
-        try:
+        results = await gather_listings(
+            client.companies.list(),
             # Use max_results to limit pagination - fetches ~2-3 pages
-            workers = list(client.workers.list(page_size=10, max_results=25))
-            print(f"Fetched {len(workers)} workers")
-            for worker in workers[:5]:  # Show first 5
-                print(f"  - {worker.id}")
-        except RipplingAPIError as e:
-            print(f"Error fetching workers: {e}")
+            client.workers.list(page_size=10, max_results=25),
+            client.users.list(page_size=10, max_results=25),
+            client.departments.list(page_size=10, max_results=25),
+            client.work_locations.list(page_size=10, max_results=25),
+        )
 
-        # =====================================================================
-        # Example 3: List Users
-        # =====================================================================
-        print("\n--- Example 3: List Users (limited to 25 for demo) ---")
-        try:
-            # Use max_results to limit pagination
-            users = list(client.users.list(page_size=10, max_results=25))
-            print(f"Fetched {len(users)} users")
-            for user in users[:5]:  # Show first 5
-                display_name = getattr(user, "display_name", None) or getattr(
-                    user, "email", user.id
-                )
-                print(f"  - {display_name}")
-        except RipplingAPIError as e:
-            print(f"Error fetching users: {e}")
-
-        # =====================================================================
-        # Example 4: List Departments
-        # =====================================================================
-        print("\n--- Example 4: List Departments ---")
-        try:
-            departments = list(client.departments.list())
-            print(f"Found {len(departments)} departments")
-            for dept in departments[:10]:  # Show first 10
-                print(f"  - {dept.name} (ID: {dept.id})")
-        except RipplingAPIError as e:
-            print(f"Error fetching departments: {e}")
-
-        # =====================================================================
-        # Example 5: List Work Locations
-        # =====================================================================
-        print("\n--- Example 5: List Work Locations ---")
-        try:
-            locations = list(client.work_locations.list())
-            print(f"Found {len(locations)} work locations")
-            for loc in locations[:10]:  # Show first 10
-                print(f"  - {loc.name} (ID: {loc.id})")
-        except RipplingAPIError as e:
-            print(f"Error fetching work locations: {e}")
+    for (heading, label, show), result in zip(EXAMPLES, results, strict=True):
+        print(f"\n--- {heading} ---")
+        if not report_failure(result, f"Error fetching {label}"):
+            show(result)
 
-    print("\n" + "=" * 60)
-    print("Basic examples complete!")
-    print("=" * 60)
+    print_banner("Basic examples complete!")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -6,109 +6,89 @@ This script demonstrates time tracking and attendance operations:
 - Time cards
 - Time entries
 - Tracks (work schedules)
+
+The four listings are independent, so they are fetched concurrently with the
+async client and then printed in order.
 """
 
-import os
-import sys
-
-from dotenv import load_dotenv
-
-load_dotenv()
-
-from rippling_client import RipplingAPIError, RipplingSettings, SyncRipplingClient
-
-
-def get_settings() -> RipplingSettings:
-    """Load settings from environment variables."""
-    bearer_token = os.getenv("RIPPLING_BEARER_TOKEN")
-    if not bearer_token:
-        print("ERROR: RIPPLING_BEARER_TOKEN environment variable is required")
-        sys.exit(1)
-
-    return RipplingSettings(
-        bearer_token=bearer_token,  # type: ignore[arg-type]
-        base_url=os.getenv("RIPPLING_BASE_URL", "https://rest.ripplingapis.com"),
-    )
-
-
-def main():
-    settings = get_settings()
-
-    with SyncRipplingClient(settings=settings) as client:
-        # =====================================================================
-        # Example 1: List Time Cards
-        # =====================================================================
-        print("\n--- Example 1: Time Cards (limited to 25) ---")
-        try:
-            time_cards = list(client.time_cards.list(page_size=10, max_results=25))
-            print(f"Fetched {len(time_cards)} time cards")
-
-            if time_cards:
-                tc = time_cards[0]
-                print("\nSample time card fields:")
-                for field in dir(tc):
-                    if not field.startswith("_"):
-                        value = getattr(tc, field, None)
-                        if not callable(value):
-                            print(f"  {field}: {value}")
-        except RipplingAPIError as e:
-            print(f"Error: {e}")
-
-        # =====================================================================
-        # Example 2: List Time Entries
-        # =====================================================================
-        print("\n--- Example 2: Time Entries (limited to 25) ---")
-        try:
-            time_entries = list(client.time_entries.list(page_size=10, max_results=25))
-            print(f"Fetched {len(time_entries)} time entries")
-
-            if time_entries:
-                entry = time_entries[0]
-                print("\nSample time entry fields:")
-                for field in dir(entry):
-                    if not field.startswith("_"):
-                        value = getattr(entry, field, None)
-                        if not callable(value):
-                            print(f"  {field}: {value}")
-        except RipplingAPIError as e:
-            print(f"Error: {e}")
-
-        # =====================================================================
-        # Example 3: List Tracks (Work Schedules)
-        # =====================================================================
-        print("\n--- Example 3: Tracks (Work Schedules) ---")
-        try:
-            tracks = list(client.tracks.list())
-            print(f"Total tracks: {len(tracks)}")
-
-            for track in tracks:
-                print(f"  - {track.name} (ID: {track.id})")
-        except RipplingAPIError as e:
-            print(f"Error: {e}")
-
-        # =====================================================================
-        # Example 4: Leave Accruals
-        # =====================================================================
-        print("\n--- Example 4: Leave Accruals (limited to 25) ---")
-        try:
-            accruals = list(client.leave_accruals.list(page_size=10, max_results=25))
-            print(f"Fetched {len(accruals)} leave accrual records")
-
-            if accruals:
-                accrual = accruals[0]
-                print("\nSample leave accrual fields:")
-                for field in dir(accrual):
-                    if not field.startswith("_"):
-                        value = getattr(accrual, field, None)
-                        if not callable(value):
-                            print(f"  {field}: {value}")
-        except RipplingAPIError as e:
-            print(f"Error: {e}")
-
-    print("\n" + "=" * 60)
-    print("Time & Attendance examples complete!")
-    print("=" * 60)
+import asyncio
+
+from _common import (
+    gather_listings,
+    open_async_client,
+    print_banner,
+    public_data_fields,
+    report_failure,
+    write_lines,
+)
+
+
+async def main():
+    async with open_async_client() as client:
+        time_cards, time_entries, tracks, accruals = await gather_listings(
+            client.time_cards.list(page_size=10, max_results=25),
+            client.time_entries.list(page_size=10, max_results=25),
+            client.tracks.list(page_size=10, max_results=25),
+            client.leave_accruals.list(page_size=10, max_results=25),
+        )
+
+    # =========================================================================
+    # Example 1: List Time Cards
+    # =========================================================================
+    print("\n--- Example 1: Time Cards (limited to 25) ---")
+    if not report_failure(time_cards):
+        print(f"Fetched {len(time_cards)} time cards")
+
+        if time_cards:
+            tc = time_cards[0]
+            print("\nSample time card fields:")
+            write_lines(
+                f"  {field}: {getattr(tc, field, None)}"
+                for field in public_data_fields(tc)
+            )
+
+    # =========================================================================
+    # Example 2: List Time Entries
+    # =========================================================================
+    print("\n--- Example 2: Time Entries (limited to 25) ---")
+    if not report_failure(time_entries):
+        print(f"Fetched {len(time_entries)} time entries")
+
+        if time_entries:
+            entry = time_entries[0]
+            print("\nSample time entry fields:")
+            write_lines(
+                f"  {field}: {getattr(entry, field, None)}"
+                for field in public_data_fields(entry)
+            )
+
+    # =========================================================================
+    # Example 3: List Tracks (Work Schedules)
+    # =========================================================================
+    print("\n--- Example 3: Tracks (Work Schedules, limited to 25) ---")
+    if not report_failure(tracks):
+        print(f"Fetched {len(tracks)} tracks")
+
+        for track in tracks:
+            print(f"  - {track.name} (ID: {track.id})")
+
+    # =========================================================================
+    # Example 4: Leave Accruals
+    # =========================================================================
+    print("\n--- Example 4: Leave Accruals (limited to 25) ---")
+    if not report_failure(accruals):
+        print(f"Fetched {len(accruals)} leave accrual records")
+
+        if accruals:
+            accrual = accruals[0]
+            print("\nSample leave accrual fields:")
+            write_lines(
+                f"  {field}: {getattr(accrual, field, None)}"
+                for field in public_data_fields(accrual)
+            )
+
+    print_banner("Time & Attendance examples complete!")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -5,92 +5,81 @@ Recruiting/ATS Examples for Rippling API Client
 This script demonstrates Applicant Tracking System operations:
 - Candidates
 - Applications
-"""
-
-import os
-import sys
 
-from dotenv import load_dotenv
+Both listings are fetched concurrently with the async client; a permission
+error on one endpoint still lets the other one print.
+"""
 
-load_dotenv()
+import asyncio
 
-from rippling_client import (
-    RipplingAPIError,
-    RipplingAuthError,
-    RipplingSettings,
-    SyncRipplingClient,
+from _common import (
+    gather_listings,
+    open_async_client,
+    print_banner,
+    public_data_fields,
+    report_failure,
+    write_lines,
 )
-
-
-def get_settings() -> RipplingSettings:
-    """Load settings from environment variables."""
-    bearer_token = os.getenv("RIPPLING_BEARER_TOKEN")
-    if not bearer_token:
-        print("ERROR: RIPPLING_BEARER_TOKEN environment variable is required")
-        sys.exit(1)
-
-    return RipplingSettings(
-        bearer_token=bearer_token,  # type: ignore[arg-type]
-        base_url=os.getenv("RIPPLING_BASE_URL", "https://rest.ripplingapis.com"),
-    )
-
-
-def main():
-    settings = get_settings()
-
-    with SyncRipplingClient(settings=settings) as client:
-        # =====================================================================
-        # Example 1: List Candidates
-        # =====================================================================
-        print("\n--- Example 1: Candidates ---")
-        try:
-            candidates = list(client.candidates.list())
-            print(f"Total candidates: {len(candidates)}")
-
-            if candidates:
-                candidate = candidates[0]
-                print("\nSample candidate fields:")
-                for field in dir(candidate):
-                    if not field.startswith("_"):
-                        value = getattr(candidate, field, None)
-                        if not callable(value):
-                            # Mask PII
-                            if field in ("email", "phone", "name"):
-                                print(f"  {field}: [MASKED]")
-                            else:
-                                print(f"  {field}: {value}")
-        except RipplingAuthError as e:
-            print(f"Auth Error (403): {e}")
-            print("  (This endpoint requires additional API permissions)")
-        except RipplingAPIError as e:
-            print(f"Error: {e}")
-
-        # =====================================================================
-        # Example 2: List Candidate Applications
-        # =====================================================================
-        print("\n--- Example 2: Candidate Applications ---")
-        try:
-            applications = list(client.candidate_applications.list())
-            print(f"Total applications: {len(applications)}")
-
-            if applications:
-                app = applications[0]
-                print("\nSample application fields:")
-                for field in dir(app):
-                    if not field.startswith("_"):
-                        value = getattr(app, field, None)
-                        if not callable(value):
-                            print(f"  {field}: {value}")
-        except RipplingAuthError as e:
-            print(f"Auth Error (403): {e}")
-            print("  (This endpoint requires additional API permissions)")
-        except RipplingAPIError as e:
-            print(f"Error: {e}")
-
-    print("\n" + "=" * 60)
-    print("Recruiting/ATS examples complete!")
-    print("=" * 60)
+from rippling_client import RipplingAuthError
+
+# Candidate fields never printed verbatim
+_PII = frozenset({"email", "phone", "name", "first_name", "last_name", "address"})
+
+
+def report_error(result) -> bool:
+    """report_failure, plus a hint for 403s on permission-gated endpoints."""
+    if isinstance(result, RipplingAuthError):
+        print(f"Auth Error (403): {result}")
+        print("  (This endpoint requires additional API permissions)")
+        return True
+    return report_failure(result)
+
+
+async def main():
+    async with open_async_client() as client:
+        # A 403 on one endpoint shouldn't hide the other
+        candidates, applications = await gather_listings(
+            client.candidates.list(page_size=10, max_results=25),
+            client.candidate_applications.list(page_size=10, max_results=25),
+        )
+
+    # =========================================================================
+    # Example 1: List Candidates
+    # =========================================================================
+    print("\n--- Example 1: Candidates (limited to 25) ---")
+    if not report_error(candidates):
+        print(f"Fetched {len(candidates)} candidates")
+
+        if candidates:
+            candidate = candidates[0]
+            print("\nSample candidate fields:")
+            # Mask PII
+            write_lines(
+                (
+                    f"  {field}: [MASKED]"
+                    if field in _PII
+                    else f"  {field}: {getattr(candidate, field, None)}"
+                )
+                for field in public_data_fields(candidate)
+            )
+
+    # =========================================================================
+    # Example 2: List Candidate Applications
+    # =========================================================================
+    print("\n--- Example 2: Candidate Applications (limited to 25) ---")
+    if not report_error(applications):
+        print(f"Fetched {len(applications)} applications")
+
+        if applications:
+            app = applications[0]
+            print("\nSample application fields:")
+            write_lines(
+                f"  {field}: {getattr(app, field, None)}"
+                for field in public_data_fields(app)
+            )
+
+    print_banner("Recruiting/ATS examples complete!")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
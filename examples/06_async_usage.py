@@ -7,187 +7,139 @@ when making multiple concurrent API calls.
 """
 
 import asyncio
-import os
-import sys
+from itertools import islice
 
-from dotenv import load_dotenv
+from _common import (
+    collect_list,
+    gather_bounded,
+    gather_listings,
+    open_async_client,
+    print_banner,
+    report_failure,
+)
 
-load_dotenv()
+# Spellings of the "pending" leave status, compared without per-row str()/lower()
+_PENDING_STATUSES = frozenset({"pending", "Pending", "PENDING"})
 
-# Type variable for generic collect_list helper
-from collections.abc import AsyncIterator
-from typing import TypeVar
 
-from rippling_client import AsyncRipplingClient, RipplingAPIError, RipplingSettings
+def _is_pending(leave_request) -> bool:
+    """Whether a leave request's status (plain string or enum) is pending."""
+    status = getattr(leave_request, "status", None)
+    return getattr(status, "value", status) in _PENDING_STATUSES
 
-T = TypeVar("T")
 
+def _report(label, result):
+    """Print the size of one gathered result, or its error."""
+    if not report_failure(result, f"{label} error"):
+        print(f"{label}: {len(result)}")
 
-async def collect_list(
-    async_iter: AsyncIterator[T], max_results: int | None = None
-) -> list[T]:
-    """Helper to collect async iterator into a list with optional limit."""
-    results: list[T] = []
-    async for item in async_iter:
-        results.append(item)
-        if max_results is not None and len(results) >= max_results:
-            break
-    return results
 
+async def _worker_detail(client, worker_id):
+    """Fetch one worker via ``workers.get``, or a one-item ``list(id=...)``.
 
-def get_settings() -> RipplingSettings:
-    """Load settings from environment variables."""
-    bearer_token = os.getenv("RIPPLING_BEARER_TOKEN")
-    if not bearer_token:
-        print("ERROR: RIPPLING_BEARER_TOKEN environment variable is required")
-        sys.exit(1)
-
-    return RipplingSettings(
-        bearer_token=bearer_token,  # type: ignore[arg-type]
-        base_url=os.getenv("RIPPLING_BASE_URL", "https://rest.ripplingapis.com"),
-    )
+    Not every client version exposes ``get`` on a resource, so fall back to a
+    filtered listing rather than failing the whole example.
+    """
+    getter = getattr(client.workers, "get", None)
+    if getter is not None:
+        return await getter(worker_id)
+    matches = await collect_list(client.workers.list(id=worker_id, max_results=1))
+    # Don't trust the filter blindly: only accept the worker that was asked for
+    return next((w for w in matches if w.id == worker_id), None)
 
 
 async def main():
-    settings = get_settings()
+    async with open_async_client() as client:
+        # Every resource the examples below need, each fetched exactly once.
+        # They are independent, so one gather runs them all concurrently and
+        # the examples then share the results instead of re-fetching.
+        unique_calls = {
+            "companies": client.companies.list(page_size=10, max_results=25),
+            "workers": client.workers.list(page_size=10, max_results=25),
+            "departments": client.departments.list(page_size=10, max_results=25),
+            "teams": client.teams.list(page_size=10, max_results=25),
+            "work_locations": client.work_locations.list(page_size=10, max_results=25),
+            "leave_requests": client.leave_requests.list(page_size=10, max_results=25),
+            "leave_types": client.leave_types.list(page_size=10, max_results=25),
+        }
+        fetched = await gather_listings(*unique_calls.values())
+        # Each result is a list, or the exception that listing raised
+        results = dict(zip(unique_calls, fetched, strict=True))
 
-    async with AsyncRipplingClient(settings=settings) as client:
         # =====================================================================
         # Example 1: Fetch Multiple Resources Concurrently
         # =====================================================================
         print("\n--- Example 1: Concurrent API Calls (limited to 25 each) ---")
 
-        try:
-            # Launch all requests concurrently for better performance
-            results = await asyncio.gather(
-                collect_list(
-                    client.companies.list(page_size=10, max_results=25), max_results=25
-                ),
-                collect_list(
-                    client.departments.list(page_size=10, max_results=25),
-                    max_results=25,
-                ),
-                collect_list(
-                    client.teams.list(page_size=10, max_results=25), max_results=25
-                ),
-                collect_list(
-                    client.work_locations.list(page_size=10, max_results=25),
-                    max_results=25,
-                ),
-                return_exceptions=True,  # Don't fail all if one fails
-            )
-
-            # Unpack results - each can be a list or an Exception
-            # due to return_exceptions=True
-            companies_result, departments_result, teams_result, locations_result = (
-                results
-            )
-
-            # Handle potential errors
-            if isinstance(companies_result, BaseException):
-                print(f"Companies error: {companies_result}")
-            else:
-                print(f"Companies: {len(companies_result)}")
-
-            if isinstance(departments_result, BaseException):
-                print(f"Departments error: {departments_result}")
-            else:
-                print(f"Departments: {len(departments_result)}")
-
-            if isinstance(teams_result, BaseException):
-                print(f"Teams error: {teams_result}")
-            else:
-                print(f"Teams: {len(teams_result)}")
-
-            if isinstance(locations_result, BaseException):
-                print(f"Locations error: {locations_result}")
-            else:
-                print(f"Work Locations: {len(locations_result)}")
-
-        except Exception as e:
-            print(f"Error in concurrent fetch: {e}")
+        for key, label in (
+            ("companies", "Companies"),
+            ("departments", "Departments"),
+            ("teams", "Teams"),
+            ("work_locations", "Work Locations"),
+        ):
+            _report(label, results[key])
 
         # =====================================================================
         # Example 2: Fetch Worker Details in Parallel
         # =====================================================================
         print("\n--- Example 2: Parallel Worker Lookups (limited to 25) ---")
 
-        try:
-            # First get list of workers (limited for demo)
-            workers = await collect_list(
-                client.workers.list(page_size=10, max_results=25), max_results=25
-            )
+        # The worker list (limited for demo) came from the shared fetch above
+        workers = results["workers"]
+        if not report_failure(workers, "Workers error"):
             print(f"Fetched {len(workers)} workers")
 
-            # If there's a get method, we could fetch details for multiple workers
-            # concurrently. For now, just demonstrate the pattern:
-            if workers and len(workers) > 1:
-                # Get first 5 worker IDs
-                worker_ids = [w.id for w in workers[:5]]
-                print(f"Sample worker IDs: {worker_ids}")
-
-        except RipplingAPIError as e:
-            print(f"Error: {e}")
-
-        # =====================================================================
-        # Example 3: Dashboard Data Aggregation
-        # =====================================================================
-        print("\n--- Example 3: Dashboard Data Aggregation (limited to 25 each) ---")
-
-        try:
-            # Simulate building a dashboard by fetching multiple data sources
-            results = await asyncio.gather(
-                collect_list(
-                    client.workers.list(page_size=10, max_results=25), max_results=25
-                ),
-                collect_list(
-                    client.departments.list(page_size=10, max_results=25),
-                    max_results=25,
-                ),
-                collect_list(
-                    client.leave_requests.list(page_size=10, max_results=25),
-                    max_results=25,
-                ),
-                collect_list(
-                    client.leave_types.list(page_size=10, max_results=25),
-                    max_results=25,
-                ),
-                return_exceptions=True,
+        if workers and not isinstance(workers, BaseException):
+            # Fetch details for the first 5 workers concurrently - one
+            # round-trip of wall time instead of five sequential ones
+            worker_ids = tuple(w.id for w in islice(workers, 5))
+            details = await gather_bounded(
+                *(_worker_detail(client, wid) for wid in worker_ids)
             )
 
-            workers, departments, leave_requests, leave_types = results
-
-            dashboard_data = {}
-
-            if not isinstance(workers, BaseException):
-                dashboard_data["total_employees"] = len(workers)
-
-            if not isinstance(departments, BaseException):
-                dashboard_data["total_departments"] = len(departments)
-
-            if not isinstance(leave_requests, BaseException):
-                dashboard_data["pending_leave_requests"] = len(
-                    [
-                        r
-                        for r in leave_requests
-                        if hasattr(r, "status") and str(r.status).lower() == "pending"
-                    ]
-                )
-                dashboard_data["total_leave_requests"] = len(leave_requests)
-
-            if not isinstance(leave_types, BaseException):
-                dashboard_data["leave_types"] = len(leave_types)
-
-            print("Dashboard Summary:")
-            for key, value in dashboard_data.items():
-                print(f"  {key}: {value}")
-
-        except Exception as e:
-            print(f"Error building dashboard: {e}")
-
-    print("\n" + "=" * 60)
-    print("Async examples complete!")
-    print("=" * 60)
+            print(f"Fetched details for {len(worker_ids)} workers:")
+            for worker_id, detail in zip(worker_ids, details, strict=True):
+                if isinstance(detail, BaseException):
+                    print(f"  - {worker_id}: error: {detail}")
+                elif detail is None:
+                    print(f"  - {worker_id}: not found")
+                else:
+                    name = getattr(detail, "name", None) or worker_id
+                    print(f"  - {name} (ID: {worker_id})")
+
+    # =========================================================================
+    # Example 3: Dashboard Data Aggregation
+    # =========================================================================
+    print("\n--- Example 3: Dashboard Data Aggregation (limited to 25 each) ---")
+
+    # Simulate building a dashboard from several data sources - all of them
+    # already fetched, so no further API calls are needed. Failed sources are
+    # left off the dashboard; workers and departments were reported above.
+    workers, departments = results["workers"], results["departments"]
+    leave_requests, leave_types = results["leave_requests"], results["leave_types"]
+    report_failure(leave_requests, "Leave Requests error")
+    report_failure(leave_types, "Leave Types error")
+
+    dashboard_data = {}
+
+    if not isinstance(workers, BaseException):
+        dashboard_data["total_employees"] = len(workers)
+
+    if not isinstance(departments, BaseException):
+        dashboard_data["total_departments"] = len(departments)
+
+    if not isinstance(leave_requests, BaseException):
+        dashboard_data["pending_leave_requests"] = sum(map(_is_pending, leave_requests))
+        dashboard_data["total_leave_requests"] = len(leave_requests)
+
+    if not isinstance(leave_types, BaseException):
+        dashboard_data["leave_types"] = len(leave_types)
+
+    print("Dashboard Summary:")
+    for key, value in dashboard_data.items():
+        print(f"  {key}: {value}")
+
+    print_banner("Async examples complete!")
 
 
 if __name__ == "__main__":
@@ -6,180 +6,232 @@ This script demonstrates proper error handling patterns
 for production-grade code.
 """
 
-import os
-import sys
-
-from dotenv import load_dotenv
-
-load_dotenv()
+import random
+from time import monotonic, sleep
 
+from _common import get_sync_client, print_banner
 from rippling_client import (
     RipplingAPIError,  # General API errors
     RipplingAuthError,  # Authentication failures
     RipplingError,  # Base exception
     RipplingRateLimitError,  # Rate limiting
     RipplingServerError,  # 5xx errors
-    RipplingSettings,
     RipplingTimeoutError,  # Timeouts
-    SyncRipplingClient,
 )
 
 
-def get_settings() -> RipplingSettings:
-    """Load settings from environment variables."""
-    bearer_token = os.getenv("RIPPLING_BEARER_TOKEN")
-    if not bearer_token:
-        print("ERROR: RIPPLING_BEARER_TOKEN environment variable is required")
-        sys.exit(1)
+class CircuitOpenError(Exception):
+    """Raised instead of calling the API while the circuit breaker is open."""
 
-    return RipplingSettings(
-        bearer_token=bearer_token,  # type: ignore[arg-type]
-        base_url=os.getenv("RIPPLING_BASE_URL", "https://rest.ripplingapis.com"),
-    )
 
+class CircuitBreaker:
+    """Minimal client-side circuit breaker (closed -> open -> half-open).
 
-def main():
-    settings = get_settings()
+    After ``fail_threshold`` consecutive server errors or timeouts the circuit
+    opens and calls fail fast with CircuitOpenError, without any network I/O,
+    until ``reset_after`` seconds have passed. The next call is then let
+    through as a trial: success closes the circuit, failure re-opens it.
+    """
 
-    with SyncRipplingClient(settings=settings) as client:
-        # =====================================================================
-        # Example 1: Basic Error Handling
-        # =====================================================================
-        print("\n--- Example 1: Basic Error Handling (limited to 25) ---")
+    def __init__(self, fail_threshold=5, reset_after=10.0):
+        self.fail_threshold = fail_threshold
+        self.reset_after = reset_after
+        self.state = "closed"
+        self.fail_count = 0
+        self.opened_at = 0.0
 
-        try:
-            workers = list(client.workers.list(page_size=10, max_results=25))
-            print(f"Successfully fetched {len(workers)} workers")
-        except RipplingAPIError as e:
-            print(f"API Error: {e}")
-            # You might log this or retry
-        except Exception as e:
-            print(f"Unexpected error: {type(e).__name__}: {e}")
-
-        # =====================================================================
-        # Example 2: Comprehensive Error Handling
-        # =====================================================================
-        print("\n--- Example 2: Comprehensive Error Handling (limited to 25) ---")
+    def call(self, fn, *args, **kwargs):
+        if self.state == "open":
+            if monotonic() - self.opened_at < self.reset_after:
+                raise CircuitOpenError("circuit open, skipping request")
+            self.state = "half-open"
 
         try:
-            departments = list(client.departments.list(page_size=10, max_results=25))
-            print(f"Successfully fetched {len(departments)} departments")
+            result = fn(*args, **kwargs)
+        except (RipplingServerError, RipplingTimeoutError):
+            self.fail_count += 1
+            if self.state == "half-open" or self.fail_count >= self.fail_threshold:
+                self.state = "open"
+                self.opened_at = monotonic()
+            raise
 
-        except RipplingAuthError as e:
-            # Handle authentication issues
-            print(f"Authentication failed: {e}")
-            print("Action: Check your RIPPLING_BEARER_TOKEN")
+        self.state = "closed"
+        self.fail_count = 0
+        return result
 
-        except RipplingRateLimitError as e:
-            # Handle rate limiting
-            print(f"Rate limited: {e}")
-            print("Action: Implement exponential backoff or reduce request frequency")
 
-        except RipplingTimeoutError as e:
-            # Handle timeouts
-            print(f"Request timed out: {e}")
-            print("Action: Retry or increase timeout settings")
+# Last successful response per resource, served when a later fetch fails.
+# Seeded by the fetches in Examples 1-3, so Example 4 can fall back to them.
+_FALLBACK: dict[str, list] = {}
 
-        except RipplingServerError as e:
-            # Handle server-side errors (5xx)
-            print(f"Server error: {e}")
-            print("Action: Retry with backoff, Rippling may be experiencing issues")
+# Data source labels from best to worst: all fresh, some stale, some missing
+_SOURCE_RANK = {"api": 0, "cache": 1, "partial": 2}
 
-        except RipplingAPIError as e:
-            # Handle other API errors (4xx, etc.)
-            print(f"API error: {e}")
 
-        except RipplingError as e:
-            # Catch-all for any Rippling-related errors
-            print(f"Rippling error: {e}")
+def cached_fetch(key, fn):
+    """Fetch ``list(fn())``, returning ``(data, source)``.
 
-        except Exception as e:
-            # Handle unexpected errors
-            print(f"Unexpected error: {type(e).__name__}: {e}")
+    Degrades freshness rather than availability: on any Rippling error (4xx,
+    5xx, timeout, rate limit, auth) the last successful result for ``key`` is
+    returned with source ``"cache"``. The error is re-raised only if there has
+    never been a successful fetch.
+    """
+    try:
+        data = list(fn())
+    except RipplingError:
+        if key in _FALLBACK:
+            return _FALLBACK[key], "cache"
+        raise
+    _FALLBACK[key] = data
+    return data, "api"
 
-        # =====================================================================
-        # Example 3: Retry Pattern
-        # =====================================================================
-        print("\n--- Example 3: Manual Retry Pattern (limited to 25) ---")
-
-        import time
-
-        max_retries = 3
-        retry_delay = 1  # seconds
-
-        for attempt in range(max_retries):
-            try:
-                teams = list(client.teams.list(page_size=10, max_results=25))
-                print(f"Attempt {attempt + 1}: Successfully fetched {len(teams)} teams")
-                break  # Success, exit retry loop
-
-            except RipplingRateLimitError:
-                if attempt < max_retries - 1:
-                    wait_time = retry_delay * (2**attempt)  # Exponential backoff
-                    print(f"Rate limited, waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
-                else:
-                    print("Max retries exceeded for rate limiting")
-
-            except RipplingServerError:
-                if attempt < max_retries - 1:
-                    wait_time = retry_delay * (2**attempt)
-                    print(f"Server error, waiting {wait_time}s before retry...")
-                    time.sleep(wait_time)
-                else:
-                    print("Max retries exceeded for server errors")
-
-            except RipplingAPIError as e:
-                # Don't retry client errors (4xx)
-                print(f"Client error (not retrying): {e}")
-                break
-
-        # =====================================================================
-        # Example 4: Graceful Degradation
-        # =====================================================================
-        print("\n--- Example 4: Graceful Degradation (limited to 25 each) ---")
-
-        def get_data_with_fallback():
-            """Fetch data with fallback to cached/default values."""
-            data = {"departments": [], "teams": [], "workers": [], "source": "api"}
 
-            try:
-                data["departments"] = list(
-                    client.departments.list(page_size=10, max_results=25)
-                )
-            except RipplingAPIError:
-                data["departments"] = []  # Could load from cache
-                data["source"] = "partial"
-                print("Warning: Using fallback for departments")
+def main():
+    client = get_sync_client()
 
-            try:
-                data["teams"] = list(client.teams.list(page_size=10, max_results=25))
-            except RipplingAPIError:
-                data["teams"] = []
-                data["source"] = "partial"
-                print("Warning: Using fallback for teams")
+    # =========================================================================
+    # Example 1: Basic Error Handling
+    # =========================================================================
+    print("\n--- Example 1: Basic Error Handling (limited to 25) ---")
 
+    try:
+        workers, _ = cached_fetch(
+            "workers", lambda: client.workers.list(page_size=10, max_results=25)
+        )
+        print(f"Successfully fetched {len(workers)} workers")
+    except RipplingAPIError as e:
+        print(f"API Error: {e}")
+        # You might log this or retry
+    except Exception as e:
+        print(f"Unexpected error: {type(e).__name__}: {e}")
+
+    # =========================================================================
+    # Example 2: Comprehensive Error Handling
+    # =========================================================================
+    print("\n--- Example 2: Comprehensive Error Handling (limited to 25) ---")
+
+    try:
+        departments, _ = cached_fetch(
+            "departments",
+            lambda: client.departments.list(page_size=10, max_results=25),
+        )
+        print(f"Successfully fetched {len(departments)} departments")
+
+    except RipplingAuthError as e:
+        # Handle authentication issues
+        print(f"Authentication failed: {e}")
+        print("Action: Check your RIPPLING_BEARER_TOKEN")
+
+    except RipplingRateLimitError as e:
+        # Handle rate limiting
+        print(f"Rate limited: {e}")
+        print("Action: Implement exponential backoff or reduce request frequency")
+
+    except RipplingTimeoutError as e:
+        # Handle timeouts
+        print(f"Request timed out: {e}")
+        print("Action: Retry or increase timeout settings")
+
+    except RipplingServerError as e:
+        # Handle server-side errors (5xx)
+        print(f"Server error: {e}")
+        print("Action: Retry with backoff, Rippling may be experiencing issues")
+
+    except RipplingAPIError as e:
+        # Handle other API errors (4xx, etc.)
+        print(f"API error: {e}")
+
+    except RipplingError as e:
+        # Catch-all for any Rippling-related errors
+        print(f"Rippling error: {e}")
+
+    except Exception as e:
+        # Handle unexpected errors
+        print(f"Unexpected error: {type(e).__name__}: {e}")
+
+    # =========================================================================
+    # Example 3: Retry Pattern
+    # =========================================================================
+    print("\n--- Example 3: Manual Retry Pattern (limited to 25) ---")
+
+    max_retries = 3
+    retry_delay = 1  # seconds
+    # Opens below max_retries, so a sustained outage fails fast on the last try
+    breaker = CircuitBreaker(fail_threshold=2)
+
+    for attempt in range(max_retries):
+        try:
+            # Listing is lazy, so the breaker must wrap the iteration itself
+            teams, _ = cached_fetch(
+                "teams",
+                lambda: breaker.call(
+                    lambda: list(client.teams.list(page_size=10, max_results=25))
+                ),
+            )
+            print(f"Attempt {attempt + 1}: Successfully fetched {len(teams)} teams")
+            break  # Success, exit retry loop
+
+        except RipplingRateLimitError:
+            if attempt < max_retries - 1:
+                # Exponential backoff with jitter, so clients don't retry in sync
+                wait_time = retry_delay * (2**attempt) * random.uniform(0.5, 1.5)
+                print(f"Rate limited, waiting {wait_time:.1f}s before retry...")
+                sleep(wait_time)
+            else:
+                print("Max retries exceeded for rate limiting")
+
+        except (RipplingServerError, RipplingTimeoutError):
+            if breaker.state == "open":
+                # No point sleeping: the next attempt is refused without I/O
+                print("Server error, circuit breaker opened")
+            elif attempt < max_retries - 1:
+                wait_time = retry_delay * (2**attempt) * random.uniform(0.5, 1.5)
+                print(f"Server error, waiting {wait_time:.1f}s before retry...")
+                sleep(wait_time)
+            else:
+                print("Max retries exceeded for server errors")
+
+        except CircuitOpenError as e:
+            # Fail fast: the API is known to be down, don't wait on it
+            print(f"Not retrying: {e}")
+            break
+
+        except (RipplingAPIError, RipplingAuthError) as e:
+            # Don't retry client errors (4xx, including 401/403)
+            print(f"Client error (not retrying): {e}")
+            break
+
+    # =========================================================================
+    # Example 4: Graceful Degradation
+    # =========================================================================
+    print("\n--- Example 4: Graceful Degradation (limited to 25 each) ---")
+
+    def get_data_with_fallback():
+        """Fetch data, falling back to the last good copy of each resource."""
+        data = {"departments": [], "teams": [], "workers": [], "source": "api"}
+
+        for key in ("departments", "teams", "workers"):
+            resource = getattr(client, key)
             try:
-                data["workers"] = list(
-                    client.workers.list(page_size=10, max_results=25)
+                data[key], src = cached_fetch(
+                    key, lambda r=resource: r.list(page_size=10, max_results=25)
                 )
-            except RipplingAPIError:
-                data["workers"] = []
-                data["source"] = "partial"
-                print("Warning: Using fallback for workers")
-
-            return data
-
-        result = get_data_with_fallback()
-        print(f"Data source: {result['source']}")
-        print(
-            f"Departments: {len(result['departments'])}, "
-            f"Teams: {len(result['teams'])}, Workers: {len(result['workers'])}"
-        )
+            except RipplingError:
+                src = "partial"  # Never fetched successfully, nothing to serve
+            if src != "api":
+                print(f"Warning: Using fallback for {key} ({src})")
+            data["source"] = max(data["source"], src, key=_SOURCE_RANK.__getitem__)
+
+        return data
+
+    result = get_data_with_fallback()
+    print(f"Data source: {result['source']}")
+    print(
+        f"Departments: {len(result['departments'])}, "
+        f"Teams: {len(result['teams'])}, Workers: {len(result['workers'])}"
+    )
 
-    print("\n" + "=" * 60)
-    print("Error handling examples complete!")
-    print("=" * 60)
+    print_banner("Error handling examples complete!")
 
 
 if __name__ == "__main__":
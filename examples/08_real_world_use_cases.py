@@ -2,302 +2,272 @@
 """
 Real-World Use Case Examples for Rippling API Client
 
-This script demonstrates practical integration scenarios.
+This script demonstrates practical integration scenarios. The resources the
+use cases need are fetched once, concurrently, with the async client and then
+shared between them.
 """
 
+import asyncio
 import json
-import os
-import sys
+from collections import Counter
 
-from dotenv import load_dotenv
+from _common import gather_listings, open_async_client, print_banner, report_failure
 
-load_dotenv()
+# Worker fields copied into each directory entry (when set)
+DIRECTORY_FIELDS = frozenset(
+    {"name", "email", "title", "department_id", "manager_id", "start_date"}
+)
 
-from rippling_client import RipplingAPIError, RipplingSettings, SyncRipplingClient
 
-
-def get_settings() -> RipplingSettings:
-    """Load settings from environment variables."""
-    bearer_token = os.getenv("RIPPLING_BEARER_TOKEN")
-    if not bearer_token:
-        print("ERROR: RIPPLING_BEARER_TOKEN environment variable is required")
-        sys.exit(1)
-
-    return RipplingSettings(
-        bearer_token=bearer_token,  # type: ignore[arg-type]
-        base_url=os.getenv("RIPPLING_BASE_URL", "https://rest.ripplingapis.com"),
-    )
-
-
-def export_employee_directory(client):
+def export_employee_directory(workers, dept_map):
     """
     Use Case: Export employee directory to JSON for integration with other systems.
     Common for syncing with Slack, internal wikis, or ID badge systems.
     """
-    print("\n--- Use Case: Export Employee Directory (limited to 25 each) ---")
-
-    try:
-        workers = list(client.workers.list(page_size=10, max_results=25))
-        departments = list(client.departments.list(page_size=10, max_results=25))
-
-        # Create a lookup for departments
-        dept_map = {d.id: d.name for d in departments}
-
-        # Build export data (simplified)
-        directory = []
-        for worker in workers:
-            entry = {
-                "id": worker.id,
-            }
-
-            # Add available fields
-            for field in [
-                "name",
-                "email",
-                "title",
-                "department_id",
-                "manager_id",
-                "start_date",
-            ]:
-                if hasattr(worker, field):
-                    value = getattr(worker, field)
-                    if value is not None:
-                        entry[field] = (
-                            str(value)
-                            if not isinstance(value, str | int | float | bool)
-                            else value
-                        )
-
-            # Resolve department name if available
-            if "department_id" in entry and entry["department_id"] in dept_map:
-                entry["department_name"] = dept_map[entry["department_id"]]
-
-            directory.append(entry)
-
-        print(f"Exported {len(directory)} employees")
-        sample = directory[0] if directory else {}
-        print(f"Sample entry: {json.dumps(sample, indent=2, default=str)}")
-
-        return directory
-
-    except RipplingAPIError as e:
-        print(f"Error exporting directory: {e}")
-        return []
-
-
-def generate_org_chart_data(client):
+    # Build export data (simplified)
+    directory = []
+    for worker in workers:
+        # One projection per worker; mode="json" turns dates etc. into strings
+        entry = {
+            "id": worker.id,
+            **worker.model_dump(
+                mode="json", include=DIRECTORY_FIELDS, exclude_none=True
+            ),
+        }
+
+        # Resolve department name if available
+        if "department_id" in entry and entry["department_id"] in dept_map:
+            entry["department_name"] = dept_map[entry["department_id"]]
+
+        directory.append(entry)
+
+    print(f"Exported {len(directory)} employees")
+    sample = directory[0] if directory else {}
+    print(f"Sample entry: {json.dumps(sample, indent=2, default=str)}")
+
+    return directory
+
+
+def generate_org_chart_data(workers):
     """
     Use Case: Generate org chart data structure.
     Common for visualization tools and reporting.
     """
-    print("\n--- Use Case: Generate Org Chart Data (limited to 25) ---")
-
-    try:
-        workers = list(client.workers.list(page_size=10, max_results=25))
-
-        # Build hierarchy
-        org_structure = {}
-        top_level = []
-
-        for worker in workers:
-            worker_id = worker.id
-            manager_id = getattr(worker, "manager_id", None)
-
-            org_structure[worker_id] = {
-                "id": worker_id,
-                "name": getattr(worker, "name", worker_id),
-                "title": getattr(worker, "title", "Unknown"),
-                "manager_id": manager_id,
-                "reports": [],
-            }
-
-        # Build relationships
-        for worker_id, data in org_structure.items():
-            manager_id = data.get("manager_id")
-            if manager_id and manager_id in org_structure:
-                org_structure[manager_id]["reports"].append(worker_id)
-            elif not manager_id:
-                top_level.append(worker_id)
-
-        print(f"Total employees: {len(org_structure)}")
-        print(f"Top-level (no manager): {len(top_level)}")
-
-        # Find who has the most direct reports
-        most_reports = max(
-            org_structure.values(), key=lambda x: len(x["reports"]), default=None
-        )
-        if most_reports and most_reports["reports"]:
-            report_count = len(most_reports["reports"])
-            print(
-                f"Most direct reports: {most_reports['name']} ({report_count} reports)"
-            )
-
-        return org_structure
-
-    except RipplingAPIError as e:
-        print(f"Error generating org chart: {e}")
-        return {}
-
-
-def department_headcount_report(client):
-    """
-    Use Case: Generate department headcount report.
-    Common for HR analytics and budget planning.
-    """
-    print("\n--- Use Case: Department Headcount Report (limited to 25 each) ---")
+    # Build hierarchy
+    org_structure = {}
+    top_level = []
+
+    for worker in workers:
+        worker_id = worker.id
+        manager_id = getattr(worker, "manager_id", None)
+
+        org_structure[worker_id] = {
+            "id": worker_id,
+            "name": getattr(worker, "name", worker_id),
+            "title": getattr(worker, "title", "Unknown"),
+            "manager_id": manager_id,
+            "reports": [],
+        }
 
-    try:
-        workers = list(client.workers.list(page_size=10, max_results=25))
-        departments = list(client.departments.list(page_size=10, max_results=25))
+    # Build relationships
+    for worker_id, data in org_structure.items():
+        manager_id = data.get("manager_id")
+        if manager_id and manager_id in org_structure:
+            org_structure[manager_id]["reports"].append(worker_id)
+        elif not manager_id:
+            top_level.append(worker_id)
 
-        # Create department lookup
-        dept_map = {d.id: d.name for d in departments}
+    print(f"Total employees: {len(org_structure)}")
+    print(f"Top-level (no manager): {len(top_level)}")
 
-        # Count by department
-        headcount = {}
-        no_dept_count = 0
+    # Find who has the most direct reports
+    most_reports = max(
+        org_structure.values(), key=lambda x: len(x["reports"]), default=None
+    )
+    if most_reports and most_reports["reports"]:
+        report_count = len(most_reports["reports"])
+        print(f"Most direct reports: {most_reports['name']} ({report_count} reports)")
 
-        for worker in workers:
-            dept_id = getattr(worker, "department_id", None)
-            if dept_id:
-                dept_name = dept_map.get(dept_id, f"Unknown ({dept_id})")
-                headcount[dept_name] = headcount.get(dept_name, 0) + 1
-            else:
-                no_dept_count += 1
+    return org_structure
 
-        # Sort by headcount descending
-        sorted_headcount = sorted(headcount.items(), key=lambda x: x[1], reverse=True)
 
-        print("\nHeadcount by Department:")
-        print("-" * 40)
-        for dept, count in sorted_headcount:
-            bar = "█" * min(count, 50)
-            print(f"{dept:30} {count:4} {bar}")
+def department_headcount_report(workers, dept_map):
+    """
+    Use Case: Generate department headcount report.
+    Common for HR analytics and budget planning.
+    """
+    # Count by department
+    headcount = Counter()
+    no_dept_count = 0
 
-        if no_dept_count:
-            print(f"{'(No Department)':30} {no_dept_count:4}")
+    for worker in workers:
+        dept_id = getattr(worker, "department_id", None)
+        if dept_id:
+            dept_name = dept_map.get(dept_id, f"Unknown ({dept_id})")
+            headcount[dept_name] += 1
+        else:
+            no_dept_count += 1
 
-        print("-" * 40)
-        print(f"{'TOTAL':30} {len(workers):4}")
+    # Sort by headcount descending
+    sorted_headcount = headcount.most_common()
 
-        return dict(sorted_headcount)
+    print("\nHeadcount by Department:")
+    print("-" * 40)
+    for dept, count in sorted_headcount:
+        bar = "█" * min(count, 50)
+        print(f"{dept:30} {count:4} {bar}")
 
-    except RipplingAPIError as e:
-        print(f"Error generating report: {e}")
-        return {}
+    if no_dept_count:
+        print(f"{'(No Department)':30} {no_dept_count:4}")
 
+    print("-" * 40)
+    print(f"{'TOTAL':30} {len(workers):4}")
 
-def leave_summary_report(client):
+    return dict(sorted_headcount)
+
+
+def leave_summary_report(leave_requests, type_map):
     """
     Use Case: Summarize leave requests for management review.
     Common for HR dashboards and manager tools.
     """
-    print("\n--- Use Case: Leave Summary Report (limited to 25 each) ---")
-
-    try:
-        leave_requests = list(client.leave_requests.list(page_size=10, max_results=25))
-        leave_types = list(client.leave_types.list(page_size=10, max_results=25))
-
-        # Create leave type lookup
-        type_map = {lt.id: lt.name for lt in leave_types}
+    # Summarize by status
+    by_status = Counter()
+    by_type = Counter()
 
-        # Summarize by status
-        by_status = {}
-        by_type = {}
+    for req in leave_requests:
+        status = str(getattr(req, "status", "unknown"))
+        by_status[status] += 1
 
-        for req in leave_requests:
-            status = str(getattr(req, "status", "unknown"))
-            by_status[status] = by_status.get(status, 0) + 1
+        leave_type_id = getattr(req, "leave_type_id", None)
+        by_type[type_map.get(leave_type_id, "Unknown")] += 1
 
-            leave_type_id = getattr(req, "leave_type_id", None)
-            leave_type_name = type_map.get(leave_type_id, "Unknown")
-            by_type[leave_type_name] = by_type.get(leave_type_name, 0) + 1
+    print(f"\nTotal Leave Requests: {len(leave_requests)}")
 
-        print(f"\nTotal Leave Requests: {len(leave_requests)}")
+    print("\nBy Status:")
+    for status, count in sorted(by_status.items()):
+        print(f"  {status}: {count}")
 
-        print("\nBy Status:")
-        for status, count in sorted(by_status.items()):
-            print(f"  {status}: {count}")
+    print("\nBy Leave Type:")
+    for leave_type, count in by_type.most_common():
+        print(f"  {leave_type}: {count}")
 
-        print("\nBy Leave Type:")
-        for leave_type, count in sorted(
-            by_type.items(), key=lambda x: x[1], reverse=True
-        ):
-            print(f"  {leave_type}: {count}")
+    return {"by_status": by_status, "by_type": by_type}
 
-        return {"by_status": by_status, "by_type": by_type}
 
-    except RipplingAPIError as e:
-        print(f"Error generating leave summary: {e}")
-        return {}
-
-
-def sync_check(client):
+def sync_check(workers, departments, locations):
     """
     Use Case: Compare data between Rippling and another system.
     Common for data integrity validation.
     """
-    print("\n--- Use Case: Data Sync Validation (limited to 25 each) ---")
-
-    try:
-        # Fetch all core data
-        workers = list(client.workers.list(page_size=10, max_results=25))
-        departments = list(client.departments.list(page_size=10, max_results=25))
-        locations = list(client.work_locations.list(page_size=10, max_results=25))
-
-        # Simulate checking against another system
-        # In real use, you'd compare with your internal database
-
-        validation_results = {
-            "workers_count": len(workers),
-            "departments_count": len(departments),
-            "locations_count": len(locations),
-            "workers_with_dept": sum(
-                1 for w in workers if getattr(w, "department_id", None)
-            ),
-            "workers_with_location": sum(
-                1 for w in workers if getattr(w, "work_location_id", None)
-            ),
+    # Simulate checking against another system
+    # In real use, you'd compare with your internal database
+
+    # One pass over workers for both completeness counts
+    with_dept = with_location = 0
+    for w in workers:
+        if getattr(w, "department_id", None):
+            with_dept += 1
+        if getattr(w, "work_location_id", None):
+            with_location += 1
+
+    validation_results = {
+        "workers_count": len(workers),
+        "departments_count": len(departments),
+        "locations_count": len(locations),
+        "workers_with_dept": with_dept,
+        "workers_with_location": with_location,
+    }
+
+    print("\nSync Validation Results:")
+    for key, value in validation_results.items():
+        print(f"  {key}: {value}")
+
+    # Calculate completeness
+    if workers:
+        dept_completeness = (
+            validation_results["workers_with_dept"] / len(workers)
+        ) * 100
+        loc_completeness = (
+            validation_results["workers_with_location"] / len(workers)
+        ) * 100
+        print("\nData Completeness:")
+        print(f"  Department assigned: {dept_completeness:.1f}%")
+        print(f"  Location assigned: {loc_completeness:.1f}%")
+
+    return validation_results
+
+
+def _id_to_name(items):
+    """Map each item's id to its name; a failed fetch's exception passes through."""
+    if isinstance(items, BaseException):
+        return items
+    return {item.id: item.name for item in items}
+
+
+# (section heading, use case, resources it needs, error message prefix)
+USE_CASES = (
+    (
+        "Use Case: Export Employee Directory (limited to 25 each)",
+        export_employee_directory,
+        ("workers", "dept_map"),
+        "Error exporting directory",
+    ),
+    (
+        "Use Case: Generate Org Chart Data (limited to 25)",
+        generate_org_chart_data,
+        ("workers",),
+        "Error generating org chart",
+    ),
+    (
+        "Use Case: Department Headcount Report (limited to 25 each)",
+        department_headcount_report,
+        ("workers", "dept_map"),
+        "Error generating report",
+    ),
+    (
+        "Use Case: Leave Summary Report (limited to 25 each)",
+        leave_summary_report,
+        ("leave_requests", "type_map"),
+        "Error generating leave summary",
+    ),
+    (
+        "Use Case: Data Sync Validation (limited to 25 each)",
+        sync_check,
+        ("workers", "departments", "work_locations"),
+        "Error in sync check",
+    ),
+)
+
+
+async def main():
+    async with open_async_client() as client:
+        # Every resource the use cases need, each fetched exactly once and
+        # all concurrently - workers alone used to be listed four times
+        unique_calls = {
+            "workers": client.workers.list(page_size=10, max_results=25),
+            "departments": client.departments.list(page_size=10, max_results=25),
+            "leave_requests": client.leave_requests.list(page_size=10, max_results=25),
+            "leave_types": client.leave_types.list(page_size=10, max_results=25),
+            "work_locations": client.work_locations.list(page_size=10, max_results=25),
         }
+        fetched = await gather_listings(*unique_calls.values())
+    data = dict(zip(unique_calls, fetched, strict=True))
 
-        print("\nSync Validation Results:")
-        for key, value in validation_results.items():
-            print(f"  {key}: {value}")
-
-        # Calculate completeness
-        if workers:
-            dept_completeness = (
-                validation_results["workers_with_dept"] / len(workers)
-            ) * 100
-            loc_completeness = (
-                validation_results["workers_with_location"] / len(workers)
-            ) * 100
-            print("\nData Completeness:")
-            print(f"  Department assigned: {dept_completeness:.1f}%")
-            print(f"  Location assigned: {loc_completeness:.1f}%")
-
-        return validation_results
-
-    except RipplingAPIError as e:
-        print(f"Error in sync check: {e}")
-        return {}
-
-
-def main():
-    settings = get_settings()
+    # Lookups shared by several use cases, built once rather than per use case
+    data["dept_map"] = _id_to_name(data["departments"])
+    data["type_map"] = _id_to_name(data["leave_types"])
 
-    with SyncRipplingClient(settings=settings) as client:
-        # Run all use cases
-        export_employee_directory(client)
-        generate_org_chart_data(client)
-        department_headcount_report(client)
-        leave_summary_report(client)
-        sync_check(client)
+    # Run all use cases against the shared data
+    for heading, use_case, resources, error_prefix in USE_CASES:
+        print(f"\n--- {heading} ---")
+        inputs = [data[name] for name in resources]
+        # Skip the use case if any of its inputs failed to load
+        if not any(report_failure(r, error_prefix) for r in inputs):
+            use_case(*inputs)
 
-    print("\n" + "=" * 60)
-    print("Real-world use case examples complete!")
-    print("=" * 60)
+    print_banner("Real-world use case examples complete!")
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -5,100 +5,99 @@ Interactive Testing Script for Rippling API Client
 Run this to interactively explore your Rippling data.
 """
 
-import os
 import sys
 
-from dotenv import load_dotenv
-
-load_dotenv()
-
-from rippling_client import (
-    RipplingAPIError,
-    RipplingSettings,
-    SyncRipplingClient,
+from _common import get_settings, get_sync_client, write_lines
+from rippling_client import RipplingAPIError
+
+
+def _lister(resource):
+    """Return a function listing ``resource`` from a client, capped at 25 items."""
+    return lambda client: getattr(client, resource).list(page_size=10, max_results=25)
+
+
+# Menu choice -> (display name, lister); built once instead of an elif ladder
+HANDLERS = {
+    "1": ("Companies", _lister("companies")),
+    "2": ("Workers", _lister("workers")),
+    "3": ("Users", _lister("users")),
+    "4": ("Departments", _lister("departments")),
+    "5": ("Teams", _lister("teams")),
+    "6": ("Work Locations", _lister("work_locations")),
+    "7": ("Legal Entities", _lister("legal_entities")),
+    "8": ("Levels", _lister("levels")),
+    "9": ("Tracks", _lister("tracks")),
+    "10": ("Compensations", _lister("compensations")),
+    "11": ("Leave Types", _lister("leave_types")),
+    "12": ("Leave Requests", _lister("leave_requests")),
+    "13": ("Leave Balances", _lister("leave_balances")),
+    "14": ("Leave Accruals", _lister("leave_accruals")),
+    "15": ("Time Cards", _lister("time_cards")),
+    "16": ("Time Entries", _lister("time_entries")),
+    "17": ("Candidates", _lister("candidates")),
+    "18": ("Candidate Applications", _lister("candidate_applications")),
+    "19": ("Custom Fields", _lister("custom_fields")),
+    "20": ("Custom Objects", _lister("custom_objects")),
+}
+
+# Attributes tried, in order, for an item's display label
+_DISPLAY_FIELDS = ("name", "display_name", "email")
+
+_RULE = "=" * 60
+
+# The whole menu, rendered once and written with a single call per prompt
+MENU_STR = "\n".join(
+    [
+        "",
+        _RULE,
+        "Rippling API Explorer (limited to 25 items per query)",
+        _RULE,
+        *(f"{choice + '.':4}List {name}" for choice, (name, _) in HANDLERS.items()),
+        "0.  Exit",
+        "-" * 60,
+        "",
+    ]
 )
 
 
-def get_settings() -> RipplingSettings:
-    """Load settings from environment variables."""
-    bearer_token = os.getenv("RIPPLING_BEARER_TOKEN")
-    if not bearer_token:
-        print("ERROR: RIPPLING_BEARER_TOKEN environment variable is required")
-        print("Set it in your .env file or export it in your shell")
-        sys.exit(1)
-
-    return RipplingSettings(
-        bearer_token=bearer_token,  # type: ignore[arg-type]
-        base_url=os.getenv("RIPPLING_BASE_URL", "https://rest.ripplingapis.com"),
-    )
-
-
 def print_menu():
     """Print the interactive menu."""
-    print("\n" + "=" * 60)
-    print("Rippling API Explorer (limited to 25 items per query)")
-    print("=" * 60)
-    print("1.  List Companies")
-    print("2.  List Workers")
-    print("3.  List Users")
-    print("4.  List Departments")
-    print("5.  List Teams")
-    print("6.  List Work Locations")
-    print("7.  List Legal Entities")
-    print("8.  List Levels")
-    print("9.  List Tracks")
-    print("10. List Compensations")
-    print("11. List Leave Types")
-    print("12. List Leave Requests")
-    print("13. List Leave Balances")
-    print("14. List Leave Accruals")
-    print("15. List Time Cards")
-    print("16. List Time Entries")
-    print("17. List Candidates")
-    print("18. List Candidate Applications")
-    print("19. List Custom Fields")
-    print("20. List Custom Objects")
-    print("0.  Exit")
-    print("-" * 60)
+    sys.stdout.write(MENU_STR)
 
 
 def explore_resource(name, items, max_display=10):
-    """Display items from a resource."""
-    print(f"\n--- {name} ({len(items)} total) ---")
+    """Display items from a resource, rendered and written in one call."""
+    lines = [f"\n--- {name} ({len(items)} total) ---"]
 
     if not items:
-        print("  No items found.")
+        lines.append("  No items found.")
+        write_lines(lines)
         return
 
     # Show first few items
     for i, item in enumerate(items[:max_display]):
-        # Try common display patterns
-        display = getattr(item, "name", None)
-        if not display:
-            display = getattr(item, "display_name", None)
-        if not display:
-            display = getattr(item, "email", None)
-        if not display:
-            display = item.id
-
-        print(f"  {i+1}. {display} (ID: {item.id})")
+        # First truthy display field, falling back to the ID
+        display = next(
+            filter(None, (getattr(item, f, None) for f in _DISPLAY_FIELDS)), item.id
+        )
+        lines.append(f"  {i+1}. {display} (ID: {item.id})")
 
     if len(items) > max_display:
-        print(f"  ... and {len(items) - max_display} more")
-
-    # Offer to show details of first item
-    if items:
-        print("\nFirst item details:")
-        first = items[0]
-        for field in sorted(dir(first)):
-            if not field.startswith("_"):
-                value = getattr(first, field, None)
-                if not callable(value):
-                    # Truncate long values
-                    str_value = str(value)
-                    if len(str_value) > 100:
-                        str_value = str_value[:100] + "..."
-                    print(f"    {field}: {str_value}")
+        lines.append(f"  ... and {len(items) - max_display} more")
+
+    # Show details of the first item
+    lines.append("\nFirst item details:")
+    first = items[0]
+    # Only the model's own fields - no dir() walk over the whole MRO
+    data = first.model_dump() if hasattr(first, "model_dump") else vars(first)
+    for field, value in sorted(data.items()):
+        # Truncate long values
+        str_value = str(value)
+        if len(str_value) > 100:
+            str_value = str_value[:100] + "..."
+        lines.append(f"    {field}: {str_value}")
+
+    write_lines(lines)
 
 
 def main():
@@ -106,127 +105,34 @@ def main():
     settings = get_settings()
     print(f"Using API: {settings.base_url}")
 
-    with SyncRipplingClient(settings=settings) as client:
-        print("Connected successfully!")
-
-        while True:
-            print_menu()
-
-            try:
-                choice = input("Enter your choice (0-20): ").strip()
-
-                if choice == "0":
-                    print("Goodbye!")
-                    break
-
-                elif choice == "1":
-                    items = list(client.companies.list(page_size=10, max_results=25))
-                    explore_resource("Companies", items)
-
-                elif choice == "2":
-                    items = list(client.workers.list(page_size=10, max_results=25))
-                    explore_resource("Workers", items)
-
-                elif choice == "3":
-                    items = list(client.users.list(page_size=10, max_results=25))
-                    explore_resource("Users", items)
-
-                elif choice == "4":
-                    items = list(client.departments.list(page_size=10, max_results=25))
-                    explore_resource("Departments", items)
-
-                elif choice == "5":
-                    items = list(client.teams.list(page_size=10, max_results=25))
-                    explore_resource("Teams", items)
-
-                elif choice == "6":
-                    items = list(
-                        client.work_locations.list(page_size=10, max_results=25)
-                    )
-                    explore_resource("Work Locations", items)
-
-                elif choice == "7":
-                    items = list(
-                        client.legal_entities.list(page_size=10, max_results=25)
-                    )
-                    explore_resource("Legal Entities", items)
-
-                elif choice == "8":
-                    items = list(client.levels.list(page_size=10, max_results=25))
-                    explore_resource("Levels", items)
-
-                elif choice == "9":
-                    items = list(client.tracks.list(page_size=10, max_results=25))
-                    explore_resource("Tracks", items)
-
-                elif choice == "10":
-                    items = list(
-                        client.compensations.list(page_size=10, max_results=25)
-                    )
-                    explore_resource("Compensations", items)
-
-                elif choice == "11":
-                    items = list(client.leave_types.list(page_size=10, max_results=25))
-                    explore_resource("Leave Types", items)
-
-                elif choice == "12":
-                    items = list(
-                        client.leave_requests.list(page_size=10, max_results=25)
-                    )
-                    explore_resource("Leave Requests", items)
-
-                elif choice == "13":
-                    items = list(
-                        client.leave_balances.list(page_size=10, max_results=25)
-                    )
-                    explore_resource("Leave Balances", items)
-
-                elif choice == "14":
-                    items = list(
-                        client.leave_accruals.list(page_size=10, max_results=25)
-                    )
-                    explore_resource("Leave Accruals", items)
-
-                elif choice == "15":
-                    items = list(client.time_cards.list(page_size=10, max_results=25))
-                    explore_resource("Time Cards", items)
-
-                elif choice == "16":
-                    items = list(client.time_entries.list(page_size=10, max_results=25))
-                    explore_resource("Time Entries", items)
-
-                elif choice == "17":
-                    items = list(client.candidates.list(page_size=10, max_results=25))
-                    explore_resource("Candidates", items)
-
-                elif choice == "18":
-                    items = list(
-                        client.candidate_applications.list(page_size=10, max_results=25)
-                    )
-                    explore_resource("Candidate Applications", items)
-
-                elif choice == "19":
-                    items = list(
-                        client.custom_fields.list(page_size=10, max_results=25)
-                    )
-                    explore_resource("Custom Fields", items)
-
-                elif choice == "20":
-                    items = list(
-                        client.custom_objects.list(page_size=10, max_results=25)
-                    )
-                    explore_resource("Custom Objects", items)
-
-                else:
-                    print("Invalid choice. Please enter 0-20.")
-
-            except RipplingAPIError as e:
-                print(f"\nAPI Error: {e}")
-            except KeyboardInterrupt:
-                print("\n\nGoodbye!")
+    client = get_sync_client()
+    print("Connected successfully!")
+
+    while True:
+        print_menu()
+
+        try:
+            choice = input("Enter your choice (0-20): ").strip()
+
+            if choice == "0":
+                print("Goodbye!")
                 break
-            except Exception as e:
-                print(f"\nError: {type(e).__name__}: {e}")
+
+            entry = HANDLERS.get(choice)
+            if entry is None:
+                print("Invalid choice. Please enter 0-20.")
+                continue
+
+            name, list_items = entry
+            explore_resource(name, list(list_items(client)))
+
+        except RipplingAPIError as e:
+            print(f"\nAPI Error: {e}")
+        except KeyboardInterrupt:
+            print("\n\nGoodbye!")
+            break
+        except Exception as e:
+            print(f"\nError: {type(e).__name__}: {e}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,325 @@
+"""
+Shared helpers for the Rippling API Client examples.
+
+Not an example itself - imported by the numbered example scripts so that
+common plumbing lives in one place.
+"""
+
+import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Iterable, Iterator
+from pathlib import Path
+from typing import Any, TypeVar
+
+from dotenv import load_dotenv
+from rippling_client import (
+    AsyncRipplingClient,
+    RipplingAPIError,
+    RipplingSettings,
+    SyncRipplingClient,
+)
+
+T = TypeVar("T")
+
+# Cap on in-flight API calls per gather, so the examples' concurrent fan-out
+# stays well inside Rippling's rate limits and the library's own
+# RIPPLING_MAX_CONCURRENT cap
+MAX_CONCURRENT_REQUESTS = 8
+
+
+@functools.lru_cache(maxsize=1)
+def ensure_env() -> None:
+    """Load variables from the .env file, once per process.
+
+    Importing several examples into one process (runner, REPL, notebook) no
+    longer re-reads .env per module. Variables already set in the shell still
+    win, as with a plain load_dotenv().
+    """
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> RipplingSettings:
+    """Load settings from environment variables.
+
+    Cached so that settings validation runs once per process, no matter how
+    many examples are imported together.
+    """
+    ensure_env()
+
+    env = os.environ
+    bearer_token = env.get("RIPPLING_BEARER_TOKEN")
+    if not bearer_token:
+        print("ERROR: RIPPLING_BEARER_TOKEN environment variable is required")
+        print("Set it in your .env file or export it in your shell")
+        sys.exit(1)
+
+    # Optional: Override base URL for sandbox/testing
+    base_url = env.get("RIPPLING_BASE_URL", "https://rest.ripplingapis.com")
+
+    return RipplingSettings(
+        bearer_token=bearer_token,  # type: ignore[arg-type]
+        base_url=base_url,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_sync_client() -> Any:
+    """Return a process-wide, already-opened sync client.
+
+    Examples run from the same REPL or runner share this client, and with it
+    the underlying HTTP connection pool, instead of each opening a new one
+    (and paying a fresh TLS handshake). The client is closed at interpreter
+    exit. With ``RIPPLING_CACHE_TTL`` set this is the caching proxy from
+    ``with_response_cache`` rather than the SyncRipplingClient itself.
+    """
+    client = SyncRipplingClient(settings=get_settings())
+    entered = client.__enter__()
+    atexit.register(client.__exit__, None, None, None)
+    return with_response_cache(entered)
+
+
+@contextlib.asynccontextmanager
+async def open_async_client():
+    """Open an async client for one example run, with the response cache.
+
+    The library caps in-flight requests with ``RIPPLING_MAX_CONCURRENT``
+    ("Max concurrent requests", default 50), well above the
+    ``MAX_CONCURRENT_REQUESTS`` fan-out used by the examples here.
+    """
+    async with AsyncRipplingClient(settings=get_settings()) as client:
+        yield with_response_cache(client)
+
+
+async def collect_list(async_iter: AsyncIterator[T]) -> list[T]:
+    """Helper to collect async iterator into a list.
+
+    Limit the result size with ``max_results`` on the ``list()`` call itself,
+    so pagination stops at the request layer.
+    """
+    return [item async for item in async_iter]
+
+
+async def gather_bounded(
+    *aws: Awaitable[Any], limit: int = MAX_CONCURRENT_REQUESTS
+) -> list[Any]:
+    """Await ``aws`` concurrently, at most ``limit`` at a time.
+
+    Results come back in order, as with ``asyncio.gather(...,
+    return_exceptions=True)``: each entry is a result or the exception that
+    awaitable raised, so one failing endpoint doesn't hide the others.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def guarded(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(guarded(aw) for aw in aws), return_exceptions=True)
+
+
+async def gather_listings(
+    *listings: AsyncIterator[Any], limit: int = MAX_CONCURRENT_REQUESTS
+) -> list[Any]:
+    """Collect several async listings concurrently, at most ``limit`` at a time.
+
+    Each entry of the result is that listing's items as a list, or the
+    exception it raised (see gather_bounded).
+    """
+    return await gather_bounded(*(collect_list(it) for it in listings), limit=limit)
+
+
+def report_failure(result: Any, prefix: str = "Error") -> bool:
+    """Report a failed gather result; return True if ``result`` is a failure.
+
+    A RipplingAPIError is printed as ``"<prefix>: <error>"`` so the example can
+    carry on; any other exception is a real failure and is re-raised.
+    """
+    if not isinstance(result, BaseException):
+        return False
+    if not isinstance(result, RipplingAPIError):
+        raise result
+    print(f"{prefix}: {result}")
+    return True
+
+
+# Public, non-callable attribute names keyed by model class. Every instance of
+# a model exposes the same fields, so dir() only needs to run once per type.
+_data_fields_cache: dict[type, tuple[str, ...]] = {}
+
+
+def public_data_fields(obj: object) -> tuple[str, ...]:
+    """Return the public data attribute names of a model instance.
+
+    The result is cached per ``type(obj)``. The first instance of each type is
+    inspected (rather than the class) because Pydantic models only expose
+    their fields on instances.
+    """
+    cls = type(obj)
+    fields = _data_fields_cache.get(cls)
+    if fields is None:
+        fields = tuple(
+            name
+            for name in dir(obj)
+            if not name.startswith("_") and not callable(getattr(obj, name, None))
+        )
+        _data_fields_cache[cls] = fields
+    return fields
+
+
+def print_banner(title: str, *, leading_newline: bool = True) -> None:
+    """Print a title framed by ``=`` rules as a single write."""
+    rule = "=" * 60
+    prefix = "\n" if leading_newline else ""
+    print(f"{prefix}{rule}\n{title}\n{rule}")
+
+
+def write_lines(lines: Iterable[str]) -> None:
+    """Write lines to stdout in one call instead of one print() per line."""
+    text = "\n".join(lines)
+    if text:
+        sys.stdout.write(text + "\n")
+
+
+# =============================================================================
+# Opt-in on-disk cache of list() results, for fast example re-runs
+# =============================================================================
+# Enable with RIPPLING_CACHE_TTL=<seconds>; RIPPLING_NO_CACHE=1 forces it off.
+# Cached pages contain real HR data, so the cache is never on by default.
+DEFAULT_CACHE_DIR = "~/.cache/rippling-examples"
+
+
+def _cache_ttl() -> float:
+    """Cache lifetime in seconds, or 0 when caching is disabled."""
+    if os.getenv("RIPPLING_NO_CACHE"):
+        return 0.0
+    return float(os.getenv("RIPPLING_CACHE_TTL") or 0)
+
+
+def with_response_cache(client: Any) -> Any:
+    """Wrap a sync or async client so ``<resource>.list()`` results are cached.
+
+    Returns the client unchanged when caching is disabled. Only ``list()``
+    calls (GETs) are cached; every other attribute passes straight through.
+    """
+    ttl = _cache_ttl()
+    if not ttl:
+        return client
+    cache_dir = Path(os.getenv("RIPPLING_CACHE_DIR", DEFAULT_CACHE_DIR)).expanduser()
+    # Entries hold real HR data and are unpickled on read: owner-only access
+    cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return _CachedClient(client, cache_dir, ttl)
+
+
+class _CachedClient:
+    """Client proxy that hands out caching wrappers for each resource."""
+
+    def __init__(self, client: Any, cache_dir: Path, ttl: float) -> None:
+        self._client = client
+        self._cache_dir = cache_dir
+        self._ttl = ttl
+        # Scope entries to the environment and credentials (never the raw token)
+        token = os.getenv("RIPPLING_BEARER_TOKEN", "")
+        token_digest = hashlib.sha256(token.encode()).hexdigest()
+        self._scope = f"{get_settings().base_url}|{token_digest}"
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if callable(getattr(attr, "list", None)):
+            return _CachedResource(self, name, attr)
+        return attr
+
+
+class _CachedResource:
+    """Resource proxy whose ``list()`` replays a fresh cache entry if present."""
+
+    def __init__(self, owner: _CachedClient, name: str, resource: Any) -> None:
+        self._owner = owner
+        self._name = name
+        self._resource = resource
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resource, name)
+
+    def list(self, **params: Any) -> Any:
+        key = f"{self._owner._scope}|{self._name}|{sorted(params.items())}"
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        path = self._owner._cache_dir / f"{digest}.pickle"
+
+        # Creating the paginator does no I/O; it tells us sync vs async
+        paginator = self._resource.list(**params)
+        is_async = hasattr(paginator, "__aiter__")
+
+        items = _read_cache(path, self._owner._ttl)
+        if items is not None:
+            return _replay_async(items) if is_async else iter(items)
+        return _record_async(paginator, path) if is_async else _record(paginator, path)
+
+
+def _read_cache(path: Path, ttl: float) -> list[Any] | None:
+    """Load a cache entry, or None if it is missing, stale or unreadable.
+
+    Entries pickled by another library version may fail to unpickle with
+    import or attribute errors; those count as a miss and are refetched.
+    """
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        with path.open("rb") as f:
+            items: list[Any] = pickle.load(f)
+        return items
+    except (
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        ImportError,
+        TypeError,
+    ):
+        return None
+
+
+def _write_cache(path: Path, items: list[Any]) -> None:
+    """Store a fully consumed listing (write-then-rename, never half-written).
+
+    Best-effort: if the cache dir is unwritable or full, the entry is skipped
+    rather than failing a listing that has already been fetched.
+    """
+    tmp = path.with_suffix(".tmp")
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(items, f)
+        tmp.replace(path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp.unlink()
+
+
+def _record(paginator: Iterable[T], path: Path) -> Iterator[T]:
+    items: list[T] = []
+    for item in paginator:
+        items.append(item)
+        yield item
+    # Only complete listings are cached; an early break leaves no entry
+    _write_cache(path, items)
+
+
+async def _record_async(paginator: AsyncIterator[T], path: Path) -> AsyncIterator[T]:
+    items: list[T] = []
+    async for item in paginator:
+        items.append(item)
+        yield item
+    _write_cache(path, items)
+
+
+async def _replay_async(items: list[T]) -> AsyncIterator[T]:
+    for item in items:
+        yield item
@@ -5,16 +5,51 @@ Quick Connection Test for Rippling API Client
 Run this first to verify your API token and connection work.
 """
 
+import asyncio
 import os
 import sys
 
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+
+async def _to_list(async_iter):
+    """Consume an async iterator into a list."""
+    return [item async for item in async_iter]
+
+
+async def fetch_sample(settings):
+    """Fetch companies and a few workers concurrently.
+
+    Each result is a list, or the exception that listing raised, so a failure
+    in one (e.g. a 403 on workers) doesn't hide how the other went.
+    """
+    from rippling_client import AsyncRipplingClient
+
+    # Built inside the running loop, and closed only once both calls finish
+    async with AsyncRipplingClient(settings=settings) as client:
+        return await asyncio.gather(
+            # Companies is usually the simplest call
+            _to_list(client.companies.list()),
+            # Limit workers to avoid fetching too many
+            _to_list(client.workers.list(max_results=10)),
+            return_exceptions=True,
+        )
+
+
+def report_error(label, error):
+    """Print why one listing failed."""
+    from rippling_client import RipplingAPIError
+
+    if isinstance(error, RipplingAPIError):
+        print(f"❌ {label} - API Error: {error}")
+    else:
+        print(f"❌ {label} - Connection error: {type(error).__name__}: {error}")
 
 
 def main():
+    # Load environment variables (on run, not at import)
+    load_dotenv()
+
     print("=" * 60)
     print("Rippling API Client - Connection Test")
     print("=" * 60)
@@ -38,7 +73,7 @@ def main():
             AsyncRipplingClient,  # noqa: F401 - testing import works
             RipplingAPIError,
             RipplingSettings,
-            SyncRipplingClient,
+            SyncRipplingClient,  # noqa: F401 - testing import works
         )
 
         print("✓ All imports successful")
@@ -66,28 +101,33 @@ def main():
     # Test API connection
     print("\nTesting API connection...")
     try:
-        with SyncRipplingClient(settings=settings) as client:
-            # Try to fetch companies (usually the simplest call)
-            companies = list(client.companies.list())
-            print("✓ API connection successful!")
-            print(f"  Companies found: {len(companies)}")
+        companies, workers = asyncio.run(fetch_sample(settings))
+    except Exception as e:
+        print(f"❌ Connection error: {type(e).__name__}: {e}")
+        sys.exit(1)
 
-            if companies:
-                print(f"  First company: {companies[0].name}")
+    # Report each listing on its own, so one failure doesn't mask the other
+    if isinstance(companies, BaseException):
+        report_error("Companies", companies)
+    else:
+        print("✓ API connection successful!")
+        print(f"  Companies found: {len(companies)}")
 
-            # Try workers too (limit to avoid fetching too many)
-            workers = list(client.workers.list(max_results=10))
-            print(f"  Workers found: {len(workers)}")
+        if companies:
+            print(f"  First company: {companies[0].name}")
 
-    except RipplingAPIError as e:
-        print(f"❌ API Error: {e}")
+    if isinstance(workers, BaseException):
+        report_error("Workers", workers)
+    else:
+        print(f"  Workers found: {len(workers)}")
+
+    errors = [r for r in (companies, workers) if isinstance(r, BaseException)]
+    if any(isinstance(e, RipplingAPIError) for e in errors):
         print("\nThis could mean:")
         print("  - Invalid API token")
         print("  - Insufficient permissions")
         print("  - API endpoint issues")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Connection error: {type(e).__name__}: {e}")
+    if errors:
         sys.exit(1)
 
     print("\n" + "=" * 60)